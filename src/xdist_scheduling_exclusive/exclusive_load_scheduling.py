@@ -1,18 +1,26 @@
 """pytest-xdist scheduler that runs exclusive tests on dedicated workers."""
 
+from collections.abc import Collection
 from functools import cached_property
 from typing import Any, Optional
 
 from xdist.dsession import LoadScheduling
 from xdist.workermanage import WorkerController
 
-from xdist_scheduling_exclusive.scheduler_base import load_exclusive_tests, trace
+from xdist_scheduling_exclusive.scheduler_base import (
+    NodeSpeeds,
+    collect_exclusive_tests,
+    load_test_durations,
+    report_unmatched_exclusive_tests,
+    trace,
+)
 
 
 class ExclusiveLoadScheduling(LoadScheduling):  # type: ignore
     """Custom xdist scheduling.
 
     Run tests from exclusive_tests.txt on separate xdist nodes.
+    Longest exclusive tests go to the fastest nodes, faster nodes receive bigger chunks of tests.
     """
 
     _exclusive_tests_indices: list[int]
@@ -21,11 +29,16 @@ class ExclusiveLoadScheduling(LoadScheduling):  # type: ignore
         self,
         config: Any,
         log: Optional[Any] = None,
-        exclusive_tests: Optional[list[str]] = None,
+        exclusive_tests: Optional[Collection[str]] = None,
+        durations: Optional[dict[str, float]] = None,
     ) -> None:
-        """Load tests from exclusive_tests.txt."""
+        """Load tests from exclusive_tests.txt and tests duration history."""
         super().__init__(config, log)
-        self.exclusive_tests = exclusive_tests or load_exclusive_tests()
+        self.exclusive_tests = frozenset(exclusive_tests or collect_exclusive_tests(config))
+        self.node_speeds = NodeSpeeds(
+            config,
+            durations if durations is not None else load_test_durations(config),
+        )
         trace(f"ExclusiveScheduling have loaded {len(self.exclusive_tests)} exclusive tests.")
 
     @property
@@ -41,38 +54,85 @@ class ExclusiveLoadScheduling(LoadScheduling):  # type: ignore
 
     @cached_property
     def exclusive_tests_indices(self) -> list[int]:
-        """Map exclusive test names to indices.
+        """Map exclusive test names to indices, the longest tests first.
 
         At __init__ tests are not collected so we do lazy initialization.
         Calculate at first access and use cache afterward.
         """
-        return [
-            self.collection.index(
-                name,
-            )  # we could create reverse-index but not worth it - less than 100 tests
-            for name in self.exclusive_tests
-            if name in self.collection
+        durations = self.node_speeds.durations
+        return sorted(
+            (index for index, name in enumerate(self.collection) if name in self.exclusive_tests),
+            key=lambda index: -durations.get(self.collection[index], 0.0),
+        )
+
+    def schedule(self) -> None:
+        """Report unmatched exclusive tests once after the initial distribution."""
+        initial = self.collection is None
+        super().schedule()
+        if initial and self.collection:
+            report_unmatched_exclusive_tests(self.exclusive_tests, self.collection)
+
+    def mark_test_complete(
+        self,
+        node: WorkerController,
+        item_index: int,
+        duration: float = 0,
+    ) -> None:
+        """Calibrate the node speed."""
+        self.node_speeds.update(node.gateway.id, self.collection[item_index], duration)
+        super().mark_test_complete(node, item_index, duration)
+
+    def remove_node(self, node: WorkerController) -> Optional[str]:
+        """Save nodes speeds for the next session."""
+        self.node_speeds.save()
+        return super().remove_node(node)  # type: ignore
+
+    def _running_exclusive(self, node: WorkerController) -> bool:
+        """Check if the node has not completed exclusive tests."""
+        return any(
+            self.collection[test] in self.exclusive_tests for test in self.node2pending[node]
+        )
+
+    def _takes_exclusive(self, node: WorkerController) -> bool:
+        """Exclusive tests go to the fastest nodes, others do not wait if nothing else left.
+
+        Nodes still running exclusive tests do not compete for the others.
+        """
+        exclusive_pending = [test for test in self.exclusive_tests_indices if test in self.pending]
+        if len(exclusive_pending) == len(self.pending):
+            return True
+        free_nodes = [
+            other.gateway.id for other in self.nodes if not self._running_exclusive(other)
         ]
+        return self.node_speeds.is_fastest(node.gateway.id, free_nodes, len(exclusive_pending))
 
     def _send_tests(self, node: WorkerController, num: int) -> None:
         tests_to_send = []
         exclusive_sent = False
 
         # Attempt to send exclusive tests first
-        for exclusive_test in self.exclusive_tests_indices[:]:  # Copy list for safe iteration
-            if exclusive_test in self.pending:
-                trace(
-                    f"Send exclusive test {self.collection[exclusive_test]} "
-                    f"to the node {node.gateway.id}",
-                )
-                self.pending.remove(exclusive_test)
-                tests_to_send.append(exclusive_test)
-                self.exclusive_tests_indices.remove(exclusive_test)  # Remove sent test
-                exclusive_sent = True
-                break  # Ensure only one exclusive test is sent per call
+        if self._takes_exclusive(node):
+            for exclusive_test in self.exclusive_tests_indices[:]:  # Copy list for safe iteration
+                if exclusive_test in self.pending:
+                    trace(
+                        f"Send exclusive test {self.collection[exclusive_test]} "
+                        f"to the node {node.gateway.id}",
+                    )
+                    self.pending.remove(exclusive_test)
+                    tests_to_send.append(exclusive_test)
+                    self.exclusive_tests_indices.remove(exclusive_test)  # Remove sent test
+                    exclusive_sent = True
+                    break  # Ensure only one exclusive test is sent per call
 
         if not exclusive_sent:
             # If no exclusive test was sent, fill in with regular pending tests
+            speed = self.node_speeds.speed(
+                node.gateway.id,
+                [other.gateway.id for other in self.nodes],
+            )
+            # Scale the chunk by the node speed, but do not exceed --maxschedchunk
+            scaled = max(1, round(num * speed))
+            num = min(scaled, max(num, self.maxschedchunk or scaled))
             for test in self.pending[:]:  # Copy list for safe iteration
                 if len(tests_to_send) >= num:
                     break  # Stop if we have enough tests to send
@@ -1,38 +1,116 @@
 """pytest-xdist LoadFileScheduling descendant that place exclusive tests to separate group."""
 
+from collections.abc import Collection
+from itertools import groupby
 from typing import Any, Optional
 
 from xdist.scheduler.loadfile import LoadFileScheduling
 
-from xdist_scheduling_exclusive.scheduler_base import load_exclusive_tests, trace
+from xdist_scheduling_exclusive.scheduler_base import (
+    EXCLUSIVE_TEST_SCOPE_PREFIX,
+    ExclusiveScopeSchedulingMixin,
+    NodeSpeeds,
+    collect_exclusive_tests,
+    load_test_durations,
+    trace,
+)
 
-EXCLUSIVE_TEST_SCOPE_PREFIX = "-exclusive-test-"
+SPLIT_SCOPE_PART_PREFIX = "-part-"
 
 
-class ExclusiveLoadFileScheduling(LoadFileScheduling):  # type: ignore  # pylint: disable=abstract-method
+class ExclusiveLoadFileScheduling(ExclusiveScopeSchedulingMixin, LoadFileScheduling):  # type: ignore  # pylint: disable=abstract-method
     """Custom xdist scheduling.
 
     Place tests from exclusive_tests.txt to unique test groups.
     Other tests are grouped as in `--dist loadfile`: tests from the same file run on the same node.
+    Files too long for one node are split into contiguous class-aligned parts.
+    Longest exclusive tests go to the fastest nodes, faster nodes keep more tests queued.
     """
 
     def __init__(
         self,
         config: Any,
         log: Optional[Any] = None,
-        exclusive_tests: Optional[list[str]] = None,
+        exclusive_tests: Optional[Collection[str]] = None,
+        durations: Optional[dict[str, float]] = None,
+        split_threshold: Optional[float] = None,
     ) -> None:
-        """Load tests from exclusive_tests.txt."""
+        """Load tests from exclusive_tests.txt and tests duration history.
+
+        Files with estimated duration above split_threshold (by default total/numnodes)
+        are split into several scopes, split_threshold=0 disables the split.
+        Without duration history the estimation is based on tests count.
+        """
         super().__init__(config, log)
-        self.exclusive_tests = exclusive_tests or load_exclusive_tests()
+        self.exclusive_tests = frozenset(exclusive_tests or collect_exclusive_tests(config))
+        self.durations = durations if durations is not None else load_test_durations(config)
+        self.split_threshold = split_threshold
+        self.split_scopes: dict[str, str] = {}
+        self.node_speeds = NodeSpeeds(config, self.durations)
         trace(
             f"ExclusiveLoadFileScheduling have loaded {len(self.exclusive_tests)} exclusive tests.",
         )
 
+    def schedule(self) -> None:
+        """Split oversized file scopes before the initial distribution."""
+        if self.collection is None and self.registered_collections:
+            self._plan_split_scopes(next(iter(self.registered_collections.values())))
+        super().schedule()
+
+    def _assign_work_unit(self, node: Any) -> None:
+        """Send exclusive tests first, to the fastest nodes."""
+        scope = self._exclusive_scope(node)
+        if scope is not None:
+            self.workqueue.move_to_end(scope, last=False)
+        super()._assign_work_unit(node)
+
+    def _plan_split_scopes(self, collection: list[str]) -> None:
+        """Assign tests of oversized files to file part scopes."""
+        known = [self.durations[nodeid] for nodeid in collection if nodeid in self.durations]
+        default_cost = sum(known) / len(known) if known else 1.0
+        costs = {
+            nodeid: self.durations.get(nodeid, default_cost)
+            for nodeid in collection
+            if nodeid not in self.exclusive_tests
+        }
+        threshold = (
+            self.split_threshold
+            if self.split_threshold is not None
+            else sum(costs.values()) / self.numnodes
+        )
+        self.split_scopes = {}
+        if threshold <= 0:
+            return
+
+        files: dict[str, list[str]] = {}
+        for nodeid in costs:
+            files.setdefault(super()._split_scope(nodeid), []).append(nodeid)
+        for file_scope, nodeids in files.items():
+            if sum(costs[nodeid] for nodeid in nodeids) <= threshold:
+                continue  # keep small files in one scope to reuse module fixtures
+            part, part_cost = 0, 0.0
+            for _, block in groupby(nodeids, key=_class_block):
+                tests = list(block)
+                block_cost = sum(costs[nodeid] for nodeid in tests)
+                if part_cost and part_cost + block_cost > threshold:
+                    part, part_cost = part + 1, 0.0
+                part_cost += block_cost
+                for nodeid in tests:
+                    self.split_scopes[nodeid] = f"{file_scope}::{SPLIT_SCOPE_PART_PREFIX}{part}"
+            trace(f"Split {file_scope} into {part + 1} scopes.")
+
     def _split_scope(self, nodeid: str) -> str:
         """Determine the scope (grouping) of a nodeid, exclusive tests in unique scopes."""
         if nodeid in self.exclusive_tests:
             # Treat each exclusive test as a unique scope to force it to run on a separate node
             return f"{EXCLUSIVE_TEST_SCOPE_PREFIX}::{nodeid}"
+        if nodeid in self.split_scopes:
+            return self.split_scopes[nodeid]
         # Fall back to the parent class's behavior for non-exclusive tests
         return super()._split_scope(nodeid)  # type: ignore
+
+
+def _class_block(nodeid: str) -> str:
+    """Tests of the same class should not be split into different scopes."""
+    parts = nodeid.split("::")
+    return "::".join(parts[:2]) if len(parts) > 2 else nodeid  # noqa: PLR2004
@@ -1,35 +1,47 @@
 """pytest-xdist LoadScopeScheduling descendant that schedule exclusive tests to dedicated nodes."""
 
+from collections.abc import Collection
 from typing import Any, Optional
 
 from xdist.scheduler.loadfile import LoadScopeScheduling
 
-from xdist_scheduling_exclusive.scheduler_base import load_exclusive_tests, trace
+from xdist_scheduling_exclusive.scheduler_base import (
+    EXCLUSIVE_TEST_SCOPE_PREFIX,
+    ExclusiveScopeSchedulingMixin,
+    NodeSpeeds,
+    collect_exclusive_tests,
+    load_test_durations,
+    trace,
+)
 
-EXCLUSIVE_TEST_SCOPE_PREFIX = "-exclusive-test-"
 
-
-class ExclusiveLoadScopeScheduling(LoadScopeScheduling):  # type: ignore  # pylint: disable=abstract-method
+class ExclusiveLoadScopeScheduling(ExclusiveScopeSchedulingMixin, LoadScopeScheduling):  # type: ignore  # pylint: disable=abstract-method
     """Custom xdist scheduling.
 
     Schedule tests from exclusive_tests.txt first and on dedicated nodes.
     Other tests are grouped as in `--dist loadfile`: tests from the same file run on the same node.
+    Exclusive tests go to the fastest nodes, faster nodes keep more tests queued.
     """
 
     def __init__(
         self,
         config: Any,
         log: Optional[Any] = None,
-        exclusive_tests: Optional[list[str]] = None,
+        exclusive_tests: Optional[Collection[str]] = None,
         dedicate_nodes: bool = False,
+        durations: Optional[dict[str, float]] = None,
     ) -> None:
-        """Load tests from exclusive_tests.txt.
+        """Load tests from exclusive_tests.txt and tests duration history.
 
         If dedicate_nodes is True, exclusive tests exclusively occupy their nodes.
         """
         super().__init__(config, log)
-        self.exclusive_tests = exclusive_tests or load_exclusive_tests()
+        self.exclusive_tests = frozenset(exclusive_tests or collect_exclusive_tests(config))
         self.dedicate_nodes = dedicate_nodes
+        self.node_speeds = NodeSpeeds(
+            config,
+            durations if durations is not None else load_test_durations(config),
+        )
         self.exclusive_tests_nodes: set[str] = set()
         self.exclusive_tests_scheduled: set[str] = set()
 
@@ -51,13 +63,10 @@ class ExclusiveLoadScopeScheduling(LoadScopeScheduling):  # type: ignore  # pyli
 
     def _assign_work_unit(self, node: Any) -> None:
         if set(self.exclusive_tests) - self.exclusive_tests_scheduled:
-            for scope, work_unit in self.workqueue.items():
-                # Find if any test in the current scope is exclusive and unscheduled
-                exclusive_test_in_scope = any(test in self.exclusive_tests for test in work_unit)
-                if exclusive_test_in_scope:
-                    # Schedule the exclusive test
-                    self._schedule_exclusive_test(node, scope, work_unit)
-                    return  # Exit after scheduling an exclusive test to ensure prioritization
+            scope = self._exclusive_scope(node)
+            if scope is not None:
+                self._schedule_exclusive_test(node, scope, self.workqueue[scope])
+                return  # Exit after scheduling an exclusive test to ensure prioritization
 
         if not self.dedicate_nodes or node.gateway.id not in self.exclusive_tests_nodes:
             super()._assign_work_unit(node)
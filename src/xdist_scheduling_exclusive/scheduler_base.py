@@ -1,7 +1,19 @@
 """Load tests from exclusive_tests.txt."""
 
+import json
 import sys
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Iterable
 from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional, Union
+
+NODE_SPEEDS_CACHE_KEY = "xdist_scheduling_exclusive/node_speeds"
+NODE_SPEED_PRIOR_SECONDS = 10.0  # weight of the cached speed, as seconds of measured tests
+EXCLUSIVE_TEST_SCOPE_PREFIX = "-exclusive-test-"
+EXCLUSIVE_TESTS_FILE = "tests/resources/exclusive_tests.txt"
+EXCLUSIVE_TESTS_INI_OPTION = "exclusive_tests"
+EXCLUSIVE_TESTS_CACHE_KEY = "xdist_scheduling_exclusive/exclusive_tests"
 
 
 def load_exclusive_tests(file_name: str = "tests/resources/exclusive_tests.txt") -> list[str]:
@@ -13,6 +25,258 @@ def load_exclusive_tests(file_name: str = "tests/resources/exclusive_tests.txt")
         raise ValueError(f"Exclusive tests list '{file_name}' not found.") from e
 
 
+def collect_exclusive_tests(
+    config: Any = None,
+    sources: Optional[Iterable[Union[str, Path]]] = None,
+    durations: Optional[dict[str, float]] = None,
+    min_duration: Optional[float] = None,
+) -> frozenset[str]:
+    """Merge exclusive tests from several sources.
+
+    Sources are text files and directories with `*.txt` lists, relative to pytest rootdir.
+    By default they are taken from `exclusive_tests` ini option,
+    or tests/resources/exclusive_tests.txt if there is no such option.
+    Tests longer than min_duration in the duration history are exclusive too.
+    Parsed files are kept in pytest cache by mtime and size, so next sessions skip parsing.
+    """
+    root = _rootdir(config)
+    if sources is None:
+        sources = _ini_sources(config) or [EXCLUSIVE_TESTS_FILE]
+    cache = getattr(config, "cache", None)
+    cached = cache.get(EXCLUSIVE_TESTS_CACHE_KEY, {}) if cache is not None else {}
+    if not isinstance(cached, dict):
+        cached = {}
+    parsed: dict[str, Any] = {}
+    tests: set[str] = set()
+    for source in sources:
+        path = root / source
+        for file in sorted(path.glob("*.txt")) if path.is_dir() else [path]:
+            tests.update(_parse_tests_list(file, cached, parsed))
+    if cache is not None and parsed != cached:
+        cache.set(EXCLUSIVE_TESTS_CACHE_KEY, parsed)
+    if durations and min_duration is not None:
+        tests.update(nodeid for nodeid, duration in durations.items() if duration >= min_duration)
+    return frozenset(tests)
+
+
+def _rootdir(config: Any) -> Path:
+    """Pytest rootdir, current directory if there is no config."""
+    rootpath = getattr(config, "rootpath", None)
+    return rootpath if isinstance(rootpath, Path) else Path()
+
+
+def add_exclusive_tests_option(parser: Any) -> None:
+    """Register `exclusive_tests` ini option, call from conftest pytest_addoption."""
+    parser.addini(
+        EXCLUSIVE_TESTS_INI_OPTION,
+        "Exclusive tests lists: files or directories with *.txt lists.",
+        type="paths",
+    )
+
+
+def _ini_sources(config: Any) -> list[Path]:
+    """Exclusive tests lists from pytest.ini or pyproject.toml, if the option is registered."""
+    try:
+        option = config.getini(EXCLUSIVE_TESTS_INI_OPTION)
+    except (AttributeError, ValueError):
+        return []
+    return list(option) if isinstance(option, list) else []
+
+
+def _parse_tests_list(
+    path: Path,
+    cached: dict[str, Any],
+    parsed: dict[str, Any],
+) -> list[str]:
+    """Parse tests list, use cached result if the file was not changed."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError as e:
+        raise ValueError(f"Exclusive tests list '{path}' not found.") from e
+    key = str(path.resolve())
+    signature = [stat.st_mtime_ns, stat.st_size]
+    entry = cached.get(key)
+    if not isinstance(entry, dict) or entry.get("signature") != signature:
+        lines = (line.strip() for line in path.read_text(encoding="utf8").splitlines())
+        tests = sorted({line for line in lines if line and not line.startswith("#")})
+        entry = {"signature": signature, "tests": tests}
+    parsed[key] = entry
+    return entry["tests"]  # type: ignore[no-any-return]
+
+
+def report_unmatched_exclusive_tests(
+    exclusive_tests: Collection[str],
+    collection: Collection[str],
+) -> None:
+    """Report exclusive tests absent from the collection."""
+    unmatched = set(exclusive_tests).difference(collection)
+    if unmatched:
+        trace(
+            f"{len(unmatched)} exclusive tests not found in collection: "
+            f"{', '.join(sorted(unmatched))}",
+        )
+
+
+def load_test_durations(
+    config: Any = None,
+    file_name: str = ".test_durations",
+) -> dict[str, float]:
+    """Load tests duration history.
+
+    JSON object mapping test node IDs to duration in seconds (pytest-split format),
+    or a list of [node ID, duration] pairs (older pytest-split format), relative to pytest rootdir.
+    Missing or broken file means no history, so an empty dict is returned.
+    """
+    path = _rootdir(config) / file_name
+    try:
+        with open(path, encoding="utf8") as f:
+            return {nodeid: float(duration) for nodeid, duration in dict(json.load(f)).items()}
+    except FileNotFoundError:
+        return {}
+    except (ValueError, TypeError) as e:
+        trace(f"Ignore broken tests duration history '{path}': {e}")
+        return {}
+
+
+class NodeSpeeds:
+    """Estimate nodes speed from completed tests timings relative to the duration history.
+
+    Speed 2.0 means the node runs tests twice as fast as recorded in the history.
+    Speeds are saved to pytest cache so the next session starts calibrated,
+    nodes are identified by gateway id which is stable for the same `--tx` options.
+    """
+
+    def __init__(self, config: Any, durations: dict[str, float]) -> None:
+        """Load speeds measured in the previous session."""
+        self.cache = getattr(config, "cache", None)
+        self.durations = durations
+        cached = self.cache.get(NODE_SPEEDS_CACHE_KEY, {}) if self.cache is not None else {}
+        self.speeds: dict[str, float] = cached if isinstance(cached, dict) else {}
+        self.expected: dict[str, float] = {}
+        self.actual: dict[str, float] = {}
+
+    def update(self, node_id: str, nodeid: str, duration: float) -> None:
+        """Account test completed by the node.
+
+        The cached speed counts as NODE_SPEED_PRIOR_SECONDS of tests,
+        so one short noisy test does not override it.
+        """
+        expected = self.durations.get(nodeid, 0.0)
+        if expected > 0 and duration > 0:
+            if node_id not in self.actual and node_id in self.speeds:
+                self.expected[node_id] = self.speeds[node_id] * NODE_SPEED_PRIOR_SECONDS
+                self.actual[node_id] = NODE_SPEED_PRIOR_SECONDS
+            self.expected[node_id] = self.expected.get(node_id, 0.0) + expected
+            self.actual[node_id] = self.actual.get(node_id, 0.0) + duration
+            self.speeds[node_id] = self.expected[node_id] / self.actual[node_id]
+
+    def speed(self, node_id: str, node_ids: Iterable[str]) -> float:
+        """Node speed relative to the average of node_ids, unknown nodes are average.
+
+        node_ids are the nodes of the current session, cache can have nodes of previous ones.
+        """
+        known = [self.speeds[other] for other in node_ids if other in self.speeds]
+        if node_id not in self.speeds or not known:
+            return 1.0
+        return self.speeds[node_id] * len(known) / sum(known)
+
+    def is_fastest(self, node_id: str, node_ids: Iterable[str], count: int) -> bool:
+        """Check if the node is among `count` fastest of node_ids."""
+        candidates = [*node_ids, node_id]
+        speed = self.speed(node_id, candidates)
+        return sum(self.speed(other, candidates) > speed for other in node_ids) < count
+
+    def save(self) -> None:
+        """Save speeds for the next session."""
+        if self.cache is not None:
+            self.cache.set(NODE_SPEEDS_CACHE_KEY, self.speeds)
+
+
+class ExclusiveScopeSchedulingMixin:
+    """Exclusive tests and node speeds handling for LoadScopeScheduling descendants.
+
+    Exclusive tests are in scopes starting with EXCLUSIVE_TEST_SCOPE_PREFIX.
+    """
+
+    exclusive_tests: frozenset[str]
+    node_speeds: NodeSpeeds
+    collection: Optional[list[str]]
+    registered_collections: dict[Any, list[str]]
+    workqueue: "OrderedDict[str, dict[str, bool]]"
+    assigned_work: dict[Any, dict[str, dict[str, bool]]]
+    nodes: list[Any]
+    _pending_of: Callable[[dict[str, dict[str, bool]]], int]
+    _assign_work_unit: Callable[[Any], None]
+
+    def schedule(self) -> None:
+        """Report unmatched exclusive tests once after the initial distribution."""
+        initial = self.collection is None
+        super().schedule()  # type: ignore[misc]
+        if initial and self.collection:
+            report_unmatched_exclusive_tests(self.exclusive_tests, self.collection)
+
+    def mark_test_complete(self, node: Any, item_index: int, duration: float = 0) -> None:
+        """Calibrate the node speed."""
+        nodeid = self.registered_collections[node][item_index]
+        self.node_speeds.update(node.gateway.id, nodeid, duration)
+        super().mark_test_complete(node, item_index, duration)  # type: ignore[misc]
+
+    def remove_node(self, node: Any) -> Optional[str]:
+        """Save nodes speeds for the next session."""
+        self.node_speeds.save()
+        return super().remove_node(node)  # type: ignore[misc,no-any-return]
+
+    def _reschedule(self, node: Any) -> None:
+        """Refill the node queue, faster nodes keep more tests pending."""
+        if node.shutting_down:
+            return
+        if not self.workqueue:
+            node.shutdown()
+            return
+        # 2: Heuristic of minimum tests to enqueue more work, as in LoadScopeScheduling
+        speed = self.node_speeds.speed(node.gateway.id, [other.gateway.id for other in self.nodes])
+        if self._pending_of(self.assigned_work[node]) > max(1, 2 * speed):
+            return
+        self._assign_work_unit(node)
+
+    def _running_exclusive(self, node: Any) -> bool:
+        """Check if the node has not completed exclusive tests."""
+        return any(
+            not all(work_unit.values())
+            for scope, work_unit in self.assigned_work.get(node, {}).items()
+            if scope.startswith(EXCLUSIVE_TEST_SCOPE_PREFIX)
+        )
+
+    def _exclusive_scope(self, node: Any) -> Optional[str]:
+        """Select the longest exclusive scope if the node is fast enough for it.
+
+        Nodes still running exclusive tests do not compete for the others.
+        If the node is too slow, move a regular scope to the queue head,
+        so exclusive tests wait for faster nodes.
+        """
+        durations = self.node_speeds.durations
+        exclusive_scopes = sorted(
+            (scope for scope in self.workqueue if scope.startswith(EXCLUSIVE_TEST_SCOPE_PREFIX)),
+            key=lambda scope: -sum(durations.get(test, 0.0) for test in self.workqueue[scope]),
+        )
+        if not exclusive_scopes:
+            return None
+        free_nodes = [
+            other.gateway.id for other in self.nodes if not self._running_exclusive(other)
+        ]
+        if len(exclusive_scopes) == len(self.workqueue) or self.node_speeds.is_fastest(
+            node.gateway.id,
+            free_nodes,
+            len(exclusive_scopes),
+        ):
+            return exclusive_scopes[0]
+        for scope in self.workqueue:
+            if not scope.startswith(EXCLUSIVE_TEST_SCOPE_PREFIX):
+                self.workqueue.move_to_end(scope, last=False)
+                break
+        return None
+
+
 def trace(*message: str) -> None:
     """Print a message with a timestamp."""
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
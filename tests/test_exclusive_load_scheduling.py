@@ -1,7 +1,13 @@
 import pytest
 from unittest.mock import Mock, patch, mock_open, MagicMock
 from xdist_scheduling_exclusive import ExclusiveLoadScheduling
-from xdist_scheduling_exclusive.scheduler_base import load_exclusive_tests, trace
+from xdist_scheduling_exclusive.scheduler_base import (
+    NodeSpeeds,
+    collect_exclusive_tests,
+    load_exclusive_tests,
+    report_unmatched_exclusive_tests,
+    trace,
+)
 
 
 @pytest.fixture
@@ -15,6 +21,8 @@ def mock_exclusive_scheduling():
         exclusive_scheduling.node2pending = MagicMock()  # Mocking the node2pending attribute
         exclusive_scheduling.collection = MagicMock()  # Mocking the collection if necessary
         exclusive_scheduling.pending = MagicMock()  # Mocking the pending list
+        exclusive_scheduling.node_speeds = NodeSpeeds(Mock(), {})
+        exclusive_scheduling.maxschedchunk = None
         return exclusive_scheduling
 
 
@@ -91,3 +99,177 @@ def test_send_non_exclusive_test_to_node(mock_exclusive_scheduling):
     mock_exclusive_scheduling._send_tests(mock_node, 1)
     assert 0 not in mock_exclusive_scheduling.pending
     mock_node.send_runtest_some.assert_called_once_with([0])
+
+
+def test_node_speeds_calibration():
+    node_speeds = NodeSpeeds(Mock(), {"test_1": 1.0, "test_2": 2.0})
+    node_speeds.update("gw0", "test_1", 0.5)
+    node_speeds.update("gw1", "test_2", 4.0)
+    node_speeds.update("gw1", "test_unknown", 4.0)  # no history, ignored
+    assert node_speeds.speeds == {"gw0": 2.0, "gw1": 0.5}
+    assert node_speeds.speed("gw0", ["gw0", "gw1", "gw2"]) == pytest.approx(1.6)
+    assert node_speeds.speed("gw2", ["gw0", "gw1", "gw2"]) == 1.0
+    assert node_speeds.is_fastest("gw0", ["gw0", "gw1", "gw2"], 1)
+    assert not node_speeds.is_fastest("gw2", ["gw0", "gw1", "gw2"], 1)
+    assert node_speeds.is_fastest("gw2", ["gw0", "gw1", "gw2"], 2)
+
+
+def test_node_speeds_ignore_stale_nodes():
+    node_speeds = NodeSpeeds(Mock(), {})
+    node_speeds.speeds = {"gw0": 2.0, "gw1": 1.0, "gw7": 100.0}  # gw7 from previous session
+    assert node_speeds.speed("gw0", ["gw0", "gw1"]) == pytest.approx(4.0 / 3.0)
+    assert node_speeds.speed("gw1", ["gw0", "gw1"]) == pytest.approx(2.0 / 3.0)
+
+
+def test_node_speeds_blend_with_cached():
+    config = Mock()
+    config.cache.get.return_value = {"gw0": 2.0}
+    node_speeds = NodeSpeeds(config, {"test_1": 1.0})
+    # one slow test counts against 10 seconds of the cached speed
+    node_speeds.update("gw0", "test_1", 2.0)
+    assert node_speeds.speeds["gw0"] == pytest.approx(21.0 / 12.0)
+
+
+def test_exclusive_load_slow_node_skips_exclusive(mock_exclusive_scheduling):
+    fast_node, slow_node = Mock(), Mock()
+    fast_node.gateway.id, slow_node.gateway.id = "gw0", "gw1"
+    mock_exclusive_scheduling.node2pending = {fast_node: [], slow_node: []}
+    mock_exclusive_scheduling.node_speeds.speeds = {"gw0": 2.0, "gw1": 1.0}
+    mock_exclusive_scheduling.collection = ["test_1", "exclusive_test_1", "test_2", "test_3"]
+    mock_exclusive_scheduling.exclusive_tests = ["exclusive_test_1"]
+    mock_exclusive_scheduling.pending = [0, 1, 2, 3]
+
+    mock_exclusive_scheduling._send_tests(slow_node, 3)
+    # slow node gets smaller chunk of regular tests
+    slow_node.send_runtest_some.assert_called_once_with([0, 2])
+    mock_exclusive_scheduling._send_tests(fast_node, 3)
+    fast_node.send_runtest_some.assert_called_once_with([1])
+
+
+def test_exclusive_load_slow_node_takes_exclusive_if_nothing_else(mock_exclusive_scheduling):
+    fast_node, slow_node = Mock(), Mock()
+    fast_node.gateway.id, slow_node.gateway.id = "gw0", "gw1"
+    mock_exclusive_scheduling.node2pending = {fast_node: [], slow_node: []}
+    mock_exclusive_scheduling.node_speeds.speeds = {"gw0": 2.0, "gw1": 1.0}
+    mock_exclusive_scheduling.collection = ["test_1", "exclusive_test_1"]
+    mock_exclusive_scheduling.exclusive_tests = ["exclusive_test_1"]
+    mock_exclusive_scheduling.pending = [1]
+
+    mock_exclusive_scheduling._send_tests(slow_node, 1)
+    slow_node.send_runtest_some.assert_called_once_with([1])
+
+
+def test_collect_exclusive_tests_merges_sources(tmp_path):
+    (tmp_path / "exclusive.txt").write_text("test_1\n# comment\n\ntest_2\n")
+    (tmp_path / "lists").mkdir()
+    (tmp_path / "lists" / "slow.txt").write_text("test_2\ntest_3\n")
+    (tmp_path / "lists" / "readme.md").write_text("not_a_test\n")
+    config = Mock(rootpath=tmp_path, cache=None)
+    config.getini.return_value = [tmp_path / "exclusive.txt", tmp_path / "lists"]
+
+    exclusive_tests = collect_exclusive_tests(
+        config, durations={"test_4": 10.0, "test_5": 0.1}, min_duration=5.0
+    )
+    assert exclusive_tests == frozenset({"test_1", "test_2", "test_3", "test_4"})
+    assert collect_exclusive_tests(config, sources=["lists"]) == frozenset({"test_2", "test_3"})
+
+
+class DictCache(dict):
+    def set(self, key, value):
+        self[key] = value
+
+
+def test_collect_exclusive_tests_cache(tmp_path):
+    tests_list = tmp_path / "exclusive.txt"
+    tests_list.write_text("test_1\n")
+    config = Mock(rootpath=tmp_path, cache=DictCache())
+    assert collect_exclusive_tests(config, sources=["exclusive.txt"]) == frozenset({"test_1"})
+
+    # next session with the same cache does not parse unchanged file
+    config = Mock(rootpath=tmp_path, cache=DictCache(config.cache))
+    with patch("pathlib.Path.read_text") as read_text:
+        assert collect_exclusive_tests(config, sources=["exclusive.txt"]) == {"test_1"}
+        read_text.assert_not_called()
+
+    tests_list.write_text("test_2\ntest_3\n")
+    assert collect_exclusive_tests(config, sources=["exclusive.txt"]) == {"test_2", "test_3"}
+
+
+def test_collect_exclusive_tests_unregistered_ini_option(tmp_path):
+    (tmp_path / "tests" / "resources").mkdir(parents=True)
+    (tmp_path / "tests" / "resources" / "exclusive_tests.txt").write_text("test_1\n")
+    config = Mock(rootpath=tmp_path, cache=None)
+    config.getini.side_effect = ValueError("unknown configuration value: 'exclusive_tests'")
+    assert collect_exclusive_tests(config) == frozenset({"test_1"})
+
+
+def test_collect_exclusive_tests_missing_source(tmp_path):
+    with pytest.raises(ValueError, match="not found"):
+        collect_exclusive_tests(Mock(rootpath=tmp_path), sources=["missing.txt"])
+
+
+def test_report_unmatched_exclusive_tests(capsys):
+    report_unmatched_exclusive_tests(frozenset({"test_1", "test_gone"}), ["test_1", "test_2"])
+    assert "1 exclusive tests not found in collection: test_gone" in capsys.readouterr().err
+
+
+def test_exclusive_load_exclusive_tests_to_fastest_nodes(mock_exclusive_scheduling):
+    nodes = [Mock() for _ in range(4)]
+    for index, node in enumerate(nodes):
+        node.gateway.id = f"gw{index}"
+    mock_exclusive_scheduling.node2pending = {node: [] for node in nodes}
+    mock_exclusive_scheduling.node_speeds = NodeSpeeds(
+        Mock(), {"exclusive_test_1": 1.0, "exclusive_test_2": 5.0}
+    )
+    mock_exclusive_scheduling.node_speeds.speeds = {"gw0": 2, "gw1": 1.5, "gw2": 1, "gw3": 0.5}
+    mock_exclusive_scheduling.collection = [
+        "exclusive_test_1",
+        "exclusive_test_2",
+        "test_1",
+        "test_2",
+        "test_3",
+        "test_4",
+    ]
+    mock_exclusive_scheduling.exclusive_tests = ["exclusive_test_1", "exclusive_test_2"]
+    mock_exclusive_scheduling.pending = [0, 1, 2, 3, 4, 5]
+
+    for node in nodes:
+        mock_exclusive_scheduling._send_tests(node, 1)
+    # the longest exclusive test goes to the fastest node
+    nodes[0].send_runtest_some.assert_called_once_with([1])
+    nodes[1].send_runtest_some.assert_called_once_with([0])
+    nodes[2].send_runtest_some.assert_called_once_with([2])
+    nodes[3].send_runtest_some.assert_called_once_with([3])
+
+
+def test_exclusive_load_more_exclusive_tests_than_nodes(mock_exclusive_scheduling):
+    nodes = [Mock() for _ in range(2)]
+    for index, node in enumerate(nodes):
+        node.gateway.id = f"gw{index}"
+    mock_exclusive_scheduling.node2pending = {node: [] for node in nodes}
+    mock_exclusive_scheduling.collection = [f"exclusive_test_{i}" for i in range(4)] + [
+        "test_1",
+        "test_2",
+    ]
+    mock_exclusive_scheduling.exclusive_tests = [f"exclusive_test_{i}" for i in range(4)]
+    mock_exclusive_scheduling.pending = list(range(6))
+
+    for _ in range(2):
+        for node in nodes:
+            mock_exclusive_scheduling._send_tests(node, 1)
+    # nodes running exclusive tests still take the next exclusive tests first
+    assert mock_exclusive_scheduling.node2pending == {nodes[0]: [0, 2], nodes[1]: [1, 3]}
+
+
+def test_exclusive_load_fast_node_chunk_respects_maxschedchunk(mock_exclusive_scheduling):
+    fast_node, slow_node = Mock(), Mock()
+    fast_node.gateway.id, slow_node.gateway.id = "gw0", "gw1"
+    mock_exclusive_scheduling.node2pending = {fast_node: [], slow_node: []}
+    mock_exclusive_scheduling.node_speeds.speeds = {"gw0": 3.0, "gw1": 1.0}
+    mock_exclusive_scheduling.collection = [f"test_{i}" for i in range(10)]
+    mock_exclusive_scheduling.exclusive_tests = []
+    mock_exclusive_scheduling.pending = list(range(10))
+    mock_exclusive_scheduling.maxschedchunk = 3
+
+    mock_exclusive_scheduling._send_tests(fast_node, 2)
+    fast_node.send_runtest_some.assert_called_once_with([0, 1, 2])
@@ -1,16 +1,18 @@
 import pytest
+import json
 from unittest.mock import Mock, patch
 
 from xdist_scheduling_exclusive.exclusive_loadfile_scheduling import (
     ExclusiveLoadFileScheduling,
     EXCLUSIVE_TEST_SCOPE_PREFIX,
 )
+from xdist_scheduling_exclusive.scheduler_base import load_test_durations
 
 
 @pytest.fixture
 def exclusive_tests_mock():
     with patch(
-        "xdist_scheduling_exclusive.exclusive_loadfile_scheduling.load_exclusive_tests"
+        "xdist_scheduling_exclusive.exclusive_loadfile_scheduling.collect_exclusive_tests"
     ) as mock:
         mock.return_value = ["test_exclusive_1", "test_exclusive_2"]
         yield mock
@@ -33,7 +35,7 @@ def log_mock():
 
 def test_exclusive_loadfile_group_file_scheduling_init(exclusive_tests_mock, config_mock, log_mock):
     scheduler = ExclusiveLoadFileScheduling(config_mock, log_mock)
-    # Verify that load_exclusive_tests was called and exclusive_tests attribute is correctly set
+    # Verify that collect_exclusive_tests was called and exclusive_tests attribute is correctly set
     exclusive_tests_mock.assert_called_once()
     assert len(scheduler.exclusive_tests) == 2
 
@@ -55,3 +57,116 @@ def test_exclusive_loadfile_split_scope_regular(exclusive_tests_mock, config_moc
         scope = scheduler._split_scope(nodeid)
         assert scope == "regular_scope"
         super_split_scope_mock.assert_called_once_with(nodeid)
+
+
+def test_exclusive_loadfile_split_oversized_file(exclusive_tests_mock, config_mock, log_mock):
+    scheduler = ExclusiveLoadFileScheduling(config_mock, log_mock, durations={})
+    scheduler.numnodes = 2
+    scheduler._plan_split_scopes(
+        [
+            "test_big.py::TestA::test_1",
+            "test_big.py::TestA::test_2",
+            "test_big.py::TestA::test_3",
+            "test_big.py::test_4",
+            "test_big.py::test_5",
+            "test_big.py::test_6",
+            "test_small.py::test_1",
+            "test_small.py::test_2",
+            "test_exclusive_1",
+        ]
+    )
+    # threshold is 8 tests / 2 nodes = 4, class TestA is not split
+    assert scheduler._split_scope("test_big.py::TestA::test_1") == "test_big.py::-part-0"
+    assert scheduler._split_scope("test_big.py::TestA::test_3") == "test_big.py::-part-0"
+    assert scheduler._split_scope("test_big.py::test_4") == "test_big.py::-part-0"
+    assert scheduler._split_scope("test_big.py::test_5") == "test_big.py::-part-1"
+    assert scheduler._split_scope("test_big.py::test_6") == "test_big.py::-part-1"
+    assert scheduler._split_scope("test_small.py::test_2") == "test_small.py"
+    assert scheduler._split_scope("test_exclusive_1").startswith(EXCLUSIVE_TEST_SCOPE_PREFIX)
+
+
+def test_exclusive_loadfile_split_by_durations(exclusive_tests_mock, config_mock, log_mock):
+    durations = {"test_a.py::test_1": 10.0, "test_b.py::test_1": 1.0, "test_b.py::test_2": 1.0}
+    scheduler = ExclusiveLoadFileScheduling(config_mock, log_mock, durations=durations)
+    scheduler.numnodes = 2
+    scheduler._plan_split_scopes(list(durations) + ["test_a.py::test_2"])
+    # test_a.py::test_2 has no history and costs as an average test
+    assert scheduler._split_scope("test_a.py::test_1") == "test_a.py::-part-0"
+    assert scheduler._split_scope("test_a.py::test_2") == "test_a.py::-part-1"
+    assert scheduler._split_scope("test_b.py::test_1") == "test_b.py"
+
+
+def test_exclusive_loadfile_zero_split_threshold(exclusive_tests_mock, config_mock, log_mock):
+    scheduler = ExclusiveLoadFileScheduling(config_mock, log_mock, durations={}, split_threshold=0)
+    scheduler.numnodes = 2
+    scheduler._plan_split_scopes(["test_big.py::test_1", "test_big.py::test_2"])
+    assert scheduler.split_scopes == {}
+    assert scheduler._split_scope("test_big.py::test_1") == "test_big.py"
+
+
+def test_load_test_durations_from_rootdir(tmp_path):
+    (tmp_path / ".test_durations").write_text(json.dumps({"test_1": 1}))
+    assert load_test_durations(Mock(rootpath=tmp_path)) == {"test_1": 1.0}
+    assert load_test_durations(Mock(rootpath=tmp_path / "empty")) == {}
+
+
+def test_exclusive_loadfile_exclusive_tests_to_fastest_nodes(config_mock, log_mock):
+    scheduler = ExclusiveLoadFileScheduling(
+        config_mock,
+        log_mock,
+        exclusive_tests=["test_exclusive_1", "test_exclusive_2"],
+        durations={"test_exclusive_1": 1.0, "test_exclusive_2": 5.0},
+    )
+    scheduler.numnodes = 4
+    scheduler.node_speeds.speeds = {"gw0": 2.0, "gw1": 1.5, "gw2": 1.0, "gw3": 0.5}
+    nodes = [Mock() for _ in range(4)]
+    for index, node in enumerate(nodes):
+        node.gateway.id = f"gw{index}"
+    collection = ["test_a.py::test_1", "test_b.py::test_1", "test_exclusive_1", "test_exclusive_2"]
+    for node in nodes:
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, collection)
+    config_mock.option.loadscopereorder = False
+    scheduler.schedule()
+
+    # the longest exclusive test goes to the fastest node
+    nodes[0].send_runtest_some.assert_called_once_with([3])
+    nodes[1].send_runtest_some.assert_called_once_with([2])
+    nodes[2].send_runtest_some.assert_called_once_with([0])
+    nodes[3].send_runtest_some.assert_called_once_with([1])
+
+
+def test_exclusive_loadfile_more_exclusive_tests_than_nodes(config_mock, log_mock):
+    exclusive_tests = [f"test_exclusive_{i}" for i in range(4)]
+    scheduler = ExclusiveLoadFileScheduling(
+        config_mock, log_mock, exclusive_tests=exclusive_tests, durations={}
+    )
+    scheduler.numnodes = 2
+    nodes = [Mock() for _ in range(2)]
+    for index, node in enumerate(nodes):
+        node.gateway.id = f"gw{index}"
+        node.shutting_down = False
+    collection = ["test_a.py::test_1", "test_b.py::test_1"] + exclusive_tests
+    for node in nodes:
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, collection)
+    config_mock.option.loadscopereorder = False
+    scheduler.schedule()
+
+    # both initial work units of each node are exclusive tests
+    assert nodes[0].send_runtest_some.call_args_list == [(([2],),), (([4],),)]
+    assert nodes[1].send_runtest_some.call_args_list == [(([3],),), (([5],),)]
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        ('[["test_1", 1], ["test_2", 2.5]]', {"test_1": 1.0, "test_2": 2.5}),
+        ("{broken", {}),
+        ('["test_1"]', {}),
+        ('{"test_1": "slow"}', {}),
+    ],
+)
+def test_load_test_durations_formats(tmp_path, content, expected):
+    (tmp_path / ".test_durations").write_text(content)
+    assert load_test_durations(Mock(rootpath=tmp_path)) == expected
@@ -2,16 +2,19 @@ from collections import OrderedDict
 
 import pytest
 from unittest.mock import MagicMock, patch, Mock
-from xdist_scheduling_exclusive.exclusive_loadscope_scheduling import ExclusiveLoadScopeScheduling
+from xdist_scheduling_exclusive.exclusive_loadscope_scheduling import (
+    EXCLUSIVE_TEST_SCOPE_PREFIX,
+    ExclusiveLoadScopeScheduling,
+)
 
 
 @pytest.fixture
 def mock_exclusive_load_scope_scheduling():
     # Patch the __init__ method of the LoadScopeScheduling parent class to prevent it from running
     with patch("xdist.scheduler.loadfile.LoadScopeScheduling.__init__", return_value=None):
-        # Patch the load_exclusive_tests function to return a mock set of exclusive tests
+        # Patch the collect_exclusive_tests function to return a mock set of exclusive tests
         with patch(
-            "xdist_scheduling_exclusive.scheduler_base.load_exclusive_tests",
+            "xdist_scheduling_exclusive.exclusive_loadscope_scheduling.collect_exclusive_tests",
             return_value={"test_exclusive_1", "test_exclusive_2"},
         ):
             exclusive_load_scope_scheduling = ExclusiveLoadScopeScheduling(Mock(), Mock())
@@ -45,3 +48,104 @@ def test_exclusive_test_scheduling(mock_exclusive_load_scope_scheduling):
     mock_exclusive_load_scope_scheduling._assign_work_unit(mock_node)
 
     # todo: asserts
+
+
+def make_nodes(*node_ids):
+    nodes = []
+    for node_id in node_ids:
+        node = MagicMock()
+        node.gateway.id = node_id
+        nodes.append(node)
+    return nodes
+
+
+def exclusive_scope(nodeid):
+    return f"{EXCLUSIVE_TEST_SCOPE_PREFIX}::{nodeid}"
+
+
+@pytest.fixture
+def speed_scheduling(mock_exclusive_load_scope_scheduling):
+    scheduling = mock_exclusive_load_scope_scheduling
+    scheduling.exclusive_tests = frozenset({"test_exclusive_1", "test_exclusive_2"})
+    scheduling.node_speeds.durations = {"test_exclusive_1": 1.0, "test_exclusive_2": 5.0}
+    scheduling.node_speeds.speeds = {"gw0": 2.0, "gw1": 1.5, "gw2": 1.0, "gw3": 0.5}
+    scheduling.workqueue = OrderedDict(
+        [
+            (exclusive_scope("test_exclusive_1"), {"test_exclusive_1": False}),
+            (exclusive_scope("test_exclusive_2"), {"test_exclusive_2": False}),
+            ("test_a.py", {"test_a.py::test_1": False}),
+            ("test_b.py", {"test_b.py::test_1": False}),
+        ]
+    )
+    nodes = make_nodes("gw0", "gw1", "gw2", "gw3")
+    scheduling.assigned_work = {node: {} for node in nodes}
+    scheduling.registered_collections = {
+        node: ["test_exclusive_1", "test_exclusive_2", "test_a.py::test_1", "test_b.py::test_1"]
+        for node in nodes
+    }
+    return scheduling, nodes
+
+
+def test_exclusive_tests_to_fastest_nodes_fastest_first(speed_scheduling):
+    scheduling, nodes = speed_scheduling
+    for node in nodes:
+        scheduling._assign_work_unit(node)
+
+    assigned = {node.gateway.id: list(scheduling.assigned_work[node]) for node in nodes}
+    # the longest exclusive test goes to the fastest node
+    assert assigned["gw0"] == [exclusive_scope("test_exclusive_2")]
+    assert assigned["gw1"] == [exclusive_scope("test_exclusive_1")]
+    assert assigned["gw2"] == ["test_a.py"]
+    assert assigned["gw3"] == ["test_b.py"]
+
+
+def test_exclusive_tests_to_fastest_nodes_slowest_first(speed_scheduling):
+    scheduling, nodes = speed_scheduling
+    for node in reversed(nodes):
+        scheduling._assign_work_unit(node)
+
+    assigned = {node.gateway.id: list(scheduling.assigned_work[node]) for node in nodes}
+    assert assigned["gw3"] == ["test_a.py"]
+    assert assigned["gw2"] == ["test_b.py"]
+    # only exclusive scopes left, gw1 does not wait for gw0
+    assert assigned["gw1"] == [exclusive_scope("test_exclusive_2")]
+    assert assigned["gw0"] == [exclusive_scope("test_exclusive_1")]
+
+
+def test_more_exclusive_tests_than_nodes(mock_exclusive_load_scope_scheduling):
+    scheduling = mock_exclusive_load_scope_scheduling
+    exclusive_tests = [f"test_exclusive_{i}" for i in range(4)]
+    scheduling.exclusive_tests = frozenset(exclusive_tests)
+    scheduling.workqueue = OrderedDict(
+        [("test_a.py", {"test_a.py::test_1": False})]
+        + [(exclusive_scope(test), {test: False}) for test in exclusive_tests]
+        + [("test_b.py", {"test_b.py::test_1": False})]
+    )
+    nodes = make_nodes("gw0", "gw1")
+    scheduling.assigned_work = {node: {} for node in nodes}
+    scheduling.registered_collections = {
+        node: exclusive_tests + ["test_a.py::test_1", "test_b.py::test_1"] for node in nodes
+    }
+    for _ in range(2):
+        for node in nodes:
+            scheduling._assign_work_unit(node)
+
+    # nodes running exclusive tests still take the next exclusive tests first
+    for node in nodes:
+        assert all(
+            scope.startswith(EXCLUSIVE_TEST_SCOPE_PREFIX)
+            for scope in scheduling.assigned_work[node]
+        )
+    assert list(scheduling.workqueue) == ["test_a.py", "test_b.py"]
+
+
+def test_slow_node_refilled_before_idle(speed_scheduling):
+    scheduling, nodes = speed_scheduling
+    scheduling.node_speeds.speeds = {"gw0": 4.0, "gw1": 4.0, "gw2": 4.0, "gw3": 0.5}
+    slow_node = nodes[3]
+    slow_node.shutting_down = False
+    scheduling.assigned_work[slow_node] = {"test_c.py": {"test_c.py::test_1": False}}
+    scheduling._assign_work_unit = MagicMock()
+
+    scheduling._reschedule(slow_node)
+    scheduling._assign_work_unit.assert_called_once_with(slow_node)